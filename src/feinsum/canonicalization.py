@@ -38,7 +38,7 @@ from feinsum.make_einsum import fused_einsum
 from immutables import Map
 from dataclasses import dataclass
 from more_itertools import zip_equal as szip
-from pytools import UniqueNameGenerator
+from pytools import UniqueNameGenerator, memoize_on_first_arg
 from bidict import frozenbidict
 
 
@@ -331,6 +331,7 @@ def get_einsum_dag(einsum: FusedEinsum) -> Map[EinsumGraphNode,
                 for k, v in einsum_dag.items()})
 
 
+@memoize_on_first_arg
 def _get_canonicalized_einsum_with_subst_mapping(
         einsum: FusedEinsum) -> Tuple[FusedEinsum, frozenbidict[str, str]]:
     """
@@ -338,6 +339,11 @@ def _get_canonicalized_einsum_with_subst_mapping(
     *canonicalized_einsum* is an instance of :class:`BatchedEinsum` which is the
     canonicalized version of *einsum* and *subst_map* is the mapping from entities
     of *einsum* to the variables in `*canonicalized_einsum*.
+
+    .. note::
+
+        Memoized on *einsum* as the graph canonicalization is expensive and
+        callers tend to canonicalize the same einsum repeatedly.
     """
 
     # collect all the uses with same desciptors together.
@@ -378,6 +378,7 @@ def get_a_matched_einsum(t_unit: lp.TranslationUnit,
     return batched_einsum, subst_map
 
 
+@memoize_on_first_arg
 def match_t_unit_to_einsum(t_unit: lp.TranslationUnit,
                            einsum: FusedEinsum,
                            *,
@@ -390,6 +391,11 @@ def match_t_unit_to_einsum(t_unit: lp.TranslationUnit,
     Returns a mapping from the entities of *einsum* to the variables of the
     corresponding matched einsum in *t_unit*. See :func:`get_a_matched_einsum` for a
     subset of grammar of :mod:`loopy` kernels to be a matched as a batched einsum.
+
+    .. note::
+
+        The result is memoized on *t_unit*. Transform templates being tuned over
+        the same translation unit thereby perform the match only once.
     """
     matched_einsum, var_in_tunit_to_var_in_matched_ensm = get_a_matched_einsum(
         t_unit,
@@ -20,6 +20,7 @@ from feinsum.einsum import (FusedEinsum, INT_CLASSES, SizeParam,
 from feinsum.typing import ToStr, TransformT
 from more_itertools import zip_equal as zip
 from feinsum.diagnostics import NoDevicePeaksInfoError
+from pytools import memoize_on_first_arg
 import logging
 logger = logging.getLogger(__name__)
 
@@ -102,6 +103,22 @@ def generate_input_arrays(queue: cl.CommandQueue,
                 })
 
 
+@memoize_on_first_arg
+def _generate_executable_loopy(einsum: FusedEinsum,
+                               schedule: Optional[ContractionSchedule] = None
+                               ) -> "lp.TranslationUnit":
+    """
+    Returns the translation unit for *einsum* that is handed to the
+    transformations being measured. Memoized so that every evaluation of an
+    einsum sees the same translation unit, which lets the transformations reuse
+    memoized analyses of it.
+    """
+    from feinsum.codegen.loopy import generate_loopy
+
+    t_unit = generate_loopy(einsum, schedule=schedule)
+    return lp.set_options(t_unit, no_numpy=True, return_dict=True)
+
+
 def validate_fused_einsum_transform(einsum: FusedEinsum,
                                     cl_ctx: cl.Context,
                                     transform: TransformT,
@@ -112,13 +129,25 @@ def validate_fused_einsum_transform(einsum: FusedEinsum,
     the results after being transformed with *transform*, then a
     :class:`RuntimeError` is raised.
     """
+    _get_validated_transformed_t_unit(einsum, cl_ctx, transform, schedule)
 
-    from feinsum.codegen.loopy import generate_loopy
+
+def _get_validated_transformed_t_unit(
+        einsum: FusedEinsum,
+        cl_ctx: cl.Context,
+        transform: TransformT,
+        schedule: Optional[ContractionSchedule] = None,
+) -> "lp.TranslationUnit":
+    """
+    Returns the translation unit for *einsum* transformed with *transform*
+    after validating it as in :func:`validate_fused_einsum_transform`. The
+    returned translation unit has been executed during the validation, so
+    timing it does not build the kernel again.
+    """
 
     cq = cl.CommandQueue(cl_ctx)
 
-    ref_t_unit = generate_loopy(einsum, schedule=schedule)
-    ref_t_unit = lp.set_options(ref_t_unit, no_numpy=True, return_dict=True)
+    ref_t_unit = _generate_executable_loopy(einsum, schedule)
     long_dim_length = 100
 
     arg_dict = (generate_input_arrays(cq, einsum, long_dim_length)
@@ -172,6 +201,7 @@ def validate_fused_einsum_transform(einsum: FusedEinsum,
                                    atol=atol, rtol=rtol)
 
     logger.info("Statistically verified the soundness of the transformation")
+    return t_unit
 
 
 def timeit(einsum: FusedEinsum,
@@ -179,7 +209,8 @@ def timeit(einsum: FusedEinsum,
            transform: TransformT,
            cl_ctx: cl.Context,
            long_dim_length: int = 100000,
-           schedule: Optional[ContractionSchedule] = None
+           schedule: Optional[ContractionSchedule] = None,
+           preallocated_args: Optional[Mapping[str, cla.Array]] = None,
            ) -> float:
     """
     Returns the runtime in seconds for executing *einsum* on OpenCL context
@@ -187,27 +218,61 @@ def timeit(einsum: FusedEinsum,
 
     :param transform: The transformation to be applied to
         :class:`loopy.TranslationUnit` lowered from *einsum*.
+    :param preallocated_args: An optional mapping from the names of the
+        values in *einsum* to device arrays that must be used as the inputs
+        of the timed kernel. Useful for re-using the inputs across multiple
+        calls. If *None*, random inputs are allocated on *cl_ctx* for this
+        call.
     """
-    from time import time
-    from feinsum.codegen.loopy import generate_loopy
+    if (preallocated_args is not None
+            and set(preallocated_args) != set(einsum.value_to_dtype)):
+        raise ValueError("preallocated_args must provide exactly the"
+                         f" values {set(einsum.value_to_dtype)}, got"
+                         f" {set(preallocated_args)}.")
 
     # Validate the transformation before fusing it
-    validate_fused_einsum_transform(einsum, cl_ctx, transform, schedule)
+    t_unit = _get_validated_transformed_t_unit(einsum, cl_ctx, transform,
+                                               schedule)
+
+    return _timeit_transformed_t_unit(einsum, t_unit,
+                                      cl_ctx=cl_ctx,
+                                      long_dim_length=long_dim_length,
+                                      schedule=schedule,
+                                      preallocated_args=preallocated_args)
+
+
+def _timeit_transformed_t_unit(
+        einsum: FusedEinsum,
+        t_unit: "lp.TranslationUnit",
+        *,
+        cl_ctx: cl.Context,
+        long_dim_length: int,
+        schedule: Optional[ContractionSchedule],
+        preallocated_args: Optional[Mapping[str, cla.Array]],
+) -> float:
+    """
+    Returns the runtime in seconds for executing *t_unit*, a translation unit
+    for *einsum* that has already been transformed and validated, see
+    :func:`_get_validated_transformed_t_unit`. Parameters are same as in
+    :func:`timeit`.
+    """
+    from time import time
 
     cq = cl.CommandQueue(cl_ctx)
 
-    t_unit = generate_loopy(einsum, schedule=schedule)
-    t_unit = lp.set_options(t_unit, no_numpy=True, return_dict=True)
+    ref_t_unit = _generate_executable_loopy(einsum, schedule)
+
+    if preallocated_args is None:
+        param_dict = generate_input_arrays(cq, einsum, long_dim_length)
+    else:
+        param_dict = Map(preallocated_args)
 
-    param_dict = generate_input_arrays(cq, einsum, long_dim_length)
     out_dict = generate_out_arrays(
         cq,
-        lp.fix_parameters(t_unit, **{name: long_dim_length
-                                     for name in (t_unit
-                                                  .default_entrypoint
-                                                  .all_params())}))
-
-    t_unit = transform(t_unit, insn_match=None, kernel_name=None)
+        lp.fix_parameters(ref_t_unit, **{name: long_dim_length
+                                         for name in (ref_t_unit
+                                                      .default_entrypoint
+                                                      .all_params())}))
 
     arg_dict = param_dict.update(out_dict)
 
@@ -302,6 +367,18 @@ def _get_footprint_gbytes(expr: FusedEinsum, long_dim_length: int) -> float:
         for arg in kernel.args) * 1e-9
 
 
+def _get_giga_op_rate_from_runtime(expr: FusedEinsum,
+                                   runtime: float,
+                                   long_dim_length: int,
+                                   ) -> Map[np.dtype[Any], float]:
+    from pymbolic.mapper.evaluator import evaluate_to_float
+    eval_context = {dim.name: long_dim_length
+                    for dim in expr.index_to_dim_length().values()
+                    if isinstance(dim, SizeParam)}
+    return Map({k: evaluate_to_float(v, eval_context)/runtime
+                for k, v in _get_giga_ops_from_einsum(expr).items()})
+
+
 def measure_giga_op_rate(expr: FusedEinsum,
                          *,
                          transform: TransformT,
@@ -319,12 +396,7 @@ def measure_giga_op_rate(expr: FusedEinsum,
                      long_dim_length=long_dim_length,
                      schedule=schedule)
 
-    from pymbolic.mapper.evaluator import evaluate_to_float
-    eval_context = {dim.name: long_dim_length
-                    for dim in expr.index_to_dim_length().values()
-                    if isinstance(dim, SizeParam)}
-    return Map({k: evaluate_to_float(v, eval_context)/runtime
-                for k, v in _get_giga_ops_from_einsum(expr).items()})
+    return _get_giga_op_rate_from_runtime(expr, runtime, long_dim_length)
 
 
 def get_roofline_flop_rate(expr: FusedEinsum, dev_name: str,
@@ -403,14 +475,29 @@ def stringify_comparison_vs_roofline(expr: FusedEinsum,
 
     dev, = cl_ctx.devices
 
-    measured_flop_rate = measure_giga_op_rate(expr,
-                                              transform=transform,
-                                              schedule=schedule,
-                                              cl_ctx=cl_ctx,
-                                              long_dim_length=long_dim_length)
+    runtime = timeit(expr,
+                     transform=transform,
+                     schedule=schedule,
+                     cl_ctx=cl_ctx,
+                     long_dim_length=long_dim_length)
+
+    return _stringify_runtime_vs_roofline(expr, runtime, dev.name, long_dim_length)
+
+
+def _stringify_runtime_vs_roofline(expr: FusedEinsum,
+                                   runtime: float,
+                                   dev_name: str,
+                                   long_dim_length: int) -> str:
+    """
+    Returns the prettified comparison of *expr* executing in *runtime* seconds
+    on the device *dev_name* wrt roofline. See
+    :func:`stringify_comparison_vs_roofline`.
+    """
+    measured_flop_rate = _get_giga_op_rate_from_runtime(expr, runtime,
+                                                        long_dim_length)
 
     try:
-        roofline_flop_rate = get_roofline_flop_rate(expr, dev.name)
+        roofline_flop_rate = get_roofline_flop_rate(expr, dev_name)
     except NoDevicePeaksInfoError:
         return _strify_measured_vs_roofline(
             measured_flop_rate,
@@ -42,6 +42,15 @@ DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)),
 TIMINGS_TABLENAME = "FEINSUM_TIMING_FACTS"
 
 
+def _get_current_timestamp() -> str:
+    from datetime import datetime
+    # resolved here rather than at import so that importing feinsum does not
+    # need the time zone database, ZoneInfo caches the zone across calls.
+    from zoneinfo import ZoneInfo
+    return (datetime.now(ZoneInfo("America/Chicago"))
+            .strftime("%Y_%m_%d_%H%M%S"))
+
+
 def dump_value_to_dtype(einsum: FusedEinsum) -> str:
     return json.dumps({val: dtype.name
                        for val, dtype in einsum.value_to_dtype.items()},
@@ -98,6 +107,10 @@ def _process_param(param: Any) -> Any:
         raise NotImplementedError(type(param))
 
 
+def dump_transform_params(transform_params: Mapping[str, Any]) -> str:
+    return json.dumps(transform_params, sort_keys=True)
+
+
 def load_transform_params(params_str: str) -> Map[str, Any]:
     preprocessed_params = json.loads(params_str)
     assert isinstance(preprocessed_params, dict)
@@ -337,22 +350,13 @@ def record_into_db(einsum: FusedEinsum,
     index_to_length = dump_index_to_length(einsum)
     use_matrix = dump_use_matrix(einsum)
     value_to_dtype = dump_value_to_dtype(einsum)
-    transform_params_str = json.dumps(transform_params, sort_keys=True)
+    transform_params_str = dump_transform_params(transform_params)
     cl_device, = cl_ctx.devices
     device_name = dump_device_name(cl_device)
     compiler_version = dump_cl_version(cl_device)
     op_info = dump_op_info(einsum, long_dim_length=long_dim_length)
 
-    # {{{ compute timestamp in Chicago
-
-    import pytz
-    from datetime import datetime
-
-    timestamp = (datetime
-                 .now(pytz.timezone("America/Chicago"))
-                 .strftime("%Y_%m_%d_%H%M%S"))
-
-    # }}}
+    timestamp = _get_current_timestamp()
 
     cursor.execute(f"INSERT INTO {TIMINGS_TABLENAME}"
                    " (subscripts, index_to_length, use_matrix,"
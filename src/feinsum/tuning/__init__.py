@@ -9,6 +9,7 @@ __doc__ = """
 .. autofunction:: autotune
 .. autofunction:: transform_param
 .. autofunction:: einsum_arg
+.. autofunction:: parameter_constraint
 
 .. class:: ConvertibleToTuningParamT
 
@@ -20,22 +21,55 @@ import os
 import sqlite3
 import numpy as np
 import pyopencl as cl
+import pyopencl.array as cla
 import loopy as lp
 import opentuner
 
 from typing import (Callable, Any, Tuple, Mapping, Optional, Sequence, Union,
-                    FrozenSet)
+                    FrozenSet, Dict, List)
 from immutables import Map
 from dataclasses import dataclass
 from functools import cached_property, cache
 from feinsum.einsum import (FusedEinsum, IntegralT, ShapeComponentT,
                             INT_CLASSES)
-from feinsum.sql_utils import DEFAULT_DB, TIMINGS_TABLENAME
+from feinsum.sql_utils import (DEFAULT_DB, TIMINGS_TABLENAME,
+                               _get_current_timestamp)
 from feinsum.typing import TransformT
 import logging
 logger = logging.getLogger(__name__)
 
 
+# Number of timing facts buffered by the tuner before writing them to the DB.
+N_RECORDS_PER_DB_COMMIT = 64
+
+
+# {{{ SQL statements issued by the tuner
+
+_RECORDED_FACTS_SQL = (" SELECT"
+                       "     transform_id,"
+                       "     transform_params,"
+                       "     runtime_in_sec"
+                       "  FROM "
+                       f"    {TIMINGS_TABLENAME}"
+                       " WHERE ("
+                       "    subscripts = ?"
+                       "    AND index_to_length = ?"
+                       "    AND use_matrix = ?"
+                       "    AND value_to_dtype = ?"
+                       "    AND giga_op_info = ?"
+                       "    AND device_name = ?"
+                       ");")
+
+_INSERT_TIMING_FACT_SQL = (f"INSERT INTO {TIMINGS_TABLENAME}"
+                           " (subscripts, index_to_length, use_matrix,"
+                           "  value_to_dtype, device_name, transform_id,"
+                           "  transform_params, runtime_in_sec,"
+                           "  compiler_version, giga_op_info, timestamp)"
+                           " VALUES (?,?,?,?,?,?,?,?,?,?,?)")
+
+# }}}
+
+
 # {{{ supported tuning parameters
 
 class TuningParameter(abc.ABC):  # noqa: B024
@@ -110,7 +144,8 @@ class einsum_arg:  # noqa: N801
             return ParametrizedTransform(
                 fn.transform,
                 (self,) + fn.einsum_derivative_args,
-                fn.transform_params)
+                fn.transform_params,
+                fn.constraints)
         else:
             from functools import cache
             return ParametrizedTransform(cache(fn), (self,), ())
@@ -140,33 +175,96 @@ class transform_param:  # noqa: N801
             return ParametrizedTransform(
                 fn.transform,
                 fn.einsum_derivative_args,
-                (self,) + fn.transform_params)
+                (self,) + fn.transform_params,
+                fn.constraints)
         else:
             from functools import cache
             return ParametrizedTransform(cache(fn), (), (self,))
 
 
+@dataclass(frozen=True, repr=True)
+class parameter_constraint:  # noqa: N801
+    """
+    Decorate to a template transformation to inform :func:`autotune` about
+    the illegal points of its parameter space, so that they are discarded
+    without applying the transformation.
+
+    :param func: A callable that is passed the einsum arguments and the
+        parameters of the template transformation as keyword arguments and
+        returns *False* if the transformation would raise a
+        :class:`~feinsum.diagnostics.InvalidParameterError` for them. Expected
+        to be much cheaper than the transformation.
+    """
+    func: Callable[..., bool]
+
+    def __call__(self, fn: Callable[..., Any]) -> "ParametrizedTransform":
+        if isinstance(fn, ParametrizedTransform):
+            return ParametrizedTransform(
+                fn.transform,
+                fn.einsum_derivative_args,
+                fn.transform_params,
+                (self,) + fn.constraints)
+        else:
+            from functools import cache
+            return ParametrizedTransform(cache(fn), (), (), (self,))
+
+
 @dataclass(frozen=True, repr=True)
 class ParametrizedTransform:
     transform: Callable[..., lp.TranslationUnit]
     einsum_derivative_args: Tuple[einsum_arg, ...]
     transform_params: Tuple[transform_param, ...]
+    constraints: Tuple[parameter_constraint, ...] = ()
 
     def __call__(self, *args: Any, **kwargs: Any) -> lp.TranslationUnit:
         return self.transform(*args, **kwargs)
 
+    def get_einsum_derived_args(self, einsum: FusedEinsum) -> Map[str, Any]:
+        """
+        Returns a mapping from the names of :attr:`einsum_derivative_args` to
+        their values for *einsum*.
+        """
+        return Map({arg.var_name: arg.func(einsum)
+                    for arg in self.einsum_derivative_args})
+
+    def is_valid(self,
+                 einsum: FusedEinsum,
+                 einsum_derived_args: Optional[Mapping[str, Any]] = None,
+                 **transform_args: Any) -> bool:
+        """
+        Returns *False* only if *transform_args* violate one of
+        :attr:`constraints` for *einsum*.
+
+        :param einsum_derived_args: See :meth:`bind_args`.
+        """
+        if not self.constraints:
+            return True
+
+        if einsum_derived_args is None:
+            einsum_derived_args = self.get_einsum_derived_args(einsum)
+
+        return all(constraint.func(**einsum_derived_args, **transform_args)
+                   for constraint in self.constraints)
+
     def bind_args(self,
                   einsum: FusedEinsum,
+                  einsum_derived_args: Optional[Mapping[str, Any]] = None,
                   **transform_args: Any) -> TransformT:
         """
         Binds *transform_args* to *self* and returns a python callable
         to the corresponding instance in the self space.
+
+        :param einsum_derived_args: The result of
+            :meth:`get_einsum_derived_args` for *einsum*. Computed if not
+            provided.
         """
         from functools import partial
 
+        if einsum_derived_args is None:
+            einsum_derived_args = self.get_einsum_derived_args(einsum)
+
         py_clbl = partial(self.transform,
-                          **{arg.var_name: arg.func(einsum)
-                             for arg in self.einsum_derivative_args},
+                          **einsum_derived_args,
                           **transform_args)
         return py_clbl
 
@@ -185,11 +283,96 @@ def _get_impls_path() -> str:
                      os.path.pardir, "tuning", "impls"))
 
 
+@cache
+def _get_db_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Returns a connection to the timing facts database at *db_path*. Shared by
+    all the tuners of a process.
+    """
+    # transactions are managed explicitly, see
+    # :meth:`OpentunerTuner.flush_records`. The connection may be used from
+    # the threads compiling the candidates, see :meth:`OpentunerTuner.compile`.
+    db = sqlite3.connect(db_path, cached_statements=256,
+                         isolation_level=None, check_same_thread=False)
+    # The journal mode and the indices persist in the DB file, leave the
+    # archive shipped with feinsum (and possibly installed read-only) as is.
+    is_default_db = (db_path == os.path.abspath(DEFAULT_DB))
+
+    if not is_default_db:
+        # WAL journaling avoids an fsync of the DB file on every commit.
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+    # keep the looked up pages in memory for the duration of the run.
+    db.execute("PRAGMA cache_size=-65536")  # in KiB
+    db.execute("PRAGMA mmap_size=268435456")  # in bytes
+    db.execute("PRAGMA temp_store=MEMORY")
+    cursor = db.cursor()
+    cursor.execute(" SELECT name FROM sqlite_master"
+                   " WHERE (type='table' AND name=?);",
+                   (TIMINGS_TABLENAME,))
+
+    if not cursor.fetchall():
+        # device table not available
+        logger.info(f"Table {TIMINGS_TABLENAME} not in DB, creating one.")
+        cursor.execute(f"CREATE TABLE {TIMINGS_TABLENAME} ("
+                       " ID INTEGER PRIMARY KEY AUTOINCREMENT,"
+                       " subscripts TEXT,"
+                       " index_to_length TEXT,"
+                       " use_matrix TEXT,"
+                       " value_to_dtype TEXT,"
+                       " device_name TEXT,"
+                       " transform_id TEXT,"
+                       " transform_params TEXT,"
+                       " runtime_in_sec REAL,"
+                       " compiler_version TEXT,"
+                       " giga_op_info TEXT,"
+                       " timestamp TEXT"
+                       ")")
+
+    if not is_default_db:
+        # covering index for looking up the timing facts of an einsum.
+        cursor.execute("CREATE INDEX IF NOT EXISTS"
+                       f" {TIMINGS_TABLENAME}_lookup_idx"
+                       f" ON {TIMINGS_TABLENAME}"
+                       " (subscripts, index_to_length, use_matrix,"
+                       "  value_to_dtype, giga_op_info, device_name,"
+                       "  transform_id, transform_params, runtime_in_sec)")
+
+    return db
+
+
+def _write_timing_facts(db: sqlite3.Connection,
+                        records: List[Tuple[Any, ...]]) -> None:
+    """
+    Inserts the rows *records* into the timing facts table of *db* in a
+    single transaction and empties *records*.
+    """
+    if not records:
+        return
+
+    db.execute("BEGIN")
+    try:
+        db.executemany(_INSERT_TIMING_FACT_SQL, records)
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    db.execute("COMMIT")
+    records.clear()
+
+
 class ConfigurationNotInDBError(LookupError):
     pass
 
 
 def get_transform_func_from_module_path(module_path: str) -> ParametrizedTransform:
+    return _get_transform_func_from_abs_module_path(os.path.abspath(module_path))
+
+
+@cache
+def _get_transform_func_from_abs_module_path(module_path: str
+                                             ) -> ParametrizedTransform:
+    # memoized so that the transform space modules are executed at most once
+    # per process.
     from importlib import util
     _, filename = os.path.split(module_path)
 
@@ -324,9 +507,11 @@ class OpentunerTuner(opentuner.MeasurementInterface):  # type: ignore[misc]
 
         self.einsum = canonicalize_einsum(einsum)
         self.cl_ctx = cl_ctx
+        self.cl_device, = cl_ctx.devices
         self.module_path = module_path
         self.long_dim_length = long_dim_length
         self.db_path = db_path
+        self._pending_records: List[Tuple[Any, ...]] = []
 
     @cached_property
     def transform_space_id(self) -> str:
@@ -339,36 +524,83 @@ class OpentunerTuner(opentuner.MeasurementInterface):  # type: ignore[misc]
 
     @cached_property
     def conn(self) -> sqlite3.Connection:
-        db = sqlite3.connect(self.db_path)
-        cursor = db.cursor()
-        cursor.execute(" SELECT name FROM sqlite_master"
-                       " WHERE (type='table' AND name=?);",
-                       (TIMINGS_TABLENAME,))
-
-        if not cursor.fetchall():
-            # device table not available
-            logger.info(f"Table {TIMINGS_TABLENAME} not in DB, creating one.")
-            cursor.execute("CREATE TABLE {TIMINGS_TABLENAME} ("
-                           " ID INTEGER PRIMARY KEY AUTOINCREMENT,"
-                           " subscripts TEXT,"
-                           " index_to_length TEXT,"
-                           " use_matrix TEXT,"
-                           " value_to_dtype TEXT,"
-                           " device_name TEXT,"
-                           " transform_id TEXT,"
-                           " transform_params TEXT,"
-                           " runtime_in_sec REAL,"
-                           " compiler_version TEXT,"
-                           " giga_op_info TEXT,"
-                           " timestamp TEXT"
-                           ")")
+        db = _get_db_connection(os.path.abspath(self.db_path))
+
+        # do not lose the buffered timing facts if the tuner is collected or
+        # the interpreter exits before they are flushed. The finalizer only
+        # refers to the buffer so that it does not keep the tuner (and its
+        # device arrays) alive.
+        import weakref
+        weakref.finalize(self, _write_timing_facts, db, self._pending_records)
+
         return db
 
     @cached_property
     def transform_func(self) -> ParametrizedTransform:
         return get_transform_func_from_module_path(self.module_path)
 
+    @cached_property
+    def _einsum_derived_args(self) -> Map[str, Any]:
+        return self.transform_func.get_einsum_derived_args(self.einsum)
+
+    @cached_property
+    def _input_arrays(self) -> Map[str, cla.Array]:
+        """
+        Device arrays fed as the inputs to the kernels timed in every trial.
+        Allocated once so that the trials do not pay for the host to device
+        transfers of the inputs.
+        """
+        from feinsum.measure import generate_input_arrays
+        cq = cl.CommandQueue(self.cl_ctx)
+        input_arrays = generate_input_arrays(cq, self.einsum,
+                                             self.long_dim_length)
+        cq.finish()
+        return input_arrays
+
+    # {{{ serialized einsum/device info used as DB keys
+
+    @cached_property
+    def _subscripts(self) -> str:
+        return self.einsum.get_subscripts()
+
+    @cached_property
+    def _index_to_length(self) -> str:
+        from feinsum.sql_utils import dump_index_to_length
+        return dump_index_to_length(self.einsum)
+
+    @cached_property
+    def _use_matrix(self) -> str:
+        from feinsum.sql_utils import dump_use_matrix
+        return dump_use_matrix(self.einsum)
+
+    @cached_property
+    def _value_to_dtype(self) -> str:
+        from feinsum.sql_utils import dump_value_to_dtype
+        return dump_value_to_dtype(self.einsum)
+
+    @cached_property
+    def _op_info(self) -> str:
+        from feinsum.sql_utils import dump_op_info
+        return dump_op_info(self.einsum, long_dim_length=self.long_dim_length)
+
+    @cached_property
+    def _device_name(self) -> str:
+        from feinsum.sql_utils import dump_device_name
+        return dump_device_name(self.cl_device)
+
+    @cached_property
+    def _compiler_version(self) -> str:
+        from feinsum.sql_utils import dump_cl_version
+        return dump_cl_version(self.cl_device)
+
+    # }}}
+
     def manipulator(self) -> "opentuner.ConfigurationManipulator":
+        return self._transform_space_manipulator
+
+    @cached_property
+    def _transform_space_manipulator(self) -> "opentuner.ConfigurationManipulator":
+        # not named '_manipulator' as that is an attribute of the superclass.
         from opentuner import ConfigurationManipulator
         manipulator = ConfigurationManipulator()
 
@@ -382,152 +614,159 @@ class OpentunerTuner(opentuner.MeasurementInterface):  # type: ignore[misc]
 
         return manipulator
 
+    @cached_property
+    def _recorded_facts(self) -> List[Tuple[str, str, float]]:
+        """
+        The ``(transform_id, transform_params, runtime_in_sec)`` of every
+        timing fact recorded in the database for :attr:`einsum` on the tuned
+        device at the start of the run. Fetched with a single query.
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute(_RECORDED_FACTS_SQL,
+                       (self._subscripts, self._index_to_length,
+                        self._use_matrix, self._value_to_dtype, self._op_info,
+                        self._device_name))
+
+        return cursor.fetchall()
+
     def seed_configurations(self) -> Sequence[Mapping[str, Any]]:
-        from feinsum.sql_utils import (dump_index_to_length,
-                                       dump_use_matrix,
-                                       dump_value_to_dtype,
-                                       dump_op_info,
-                                       dump_device_name,
-                                       load_transform_params,
-                                       )
+        from feinsum.sql_utils import load_transform_params
 
-        cursor = self.conn.cursor()
-        subscripts = self.einsum.get_subscripts()
-        index_to_length = dump_index_to_length(self.einsum)
-        use_matrix = dump_use_matrix(self.einsum)
-        op_info = dump_op_info(self.einsum, self.long_dim_length)
-        value_to_dtype = dump_value_to_dtype(self.einsum)
-        dev, = self.cl_ctx.devices
-        device_name = dump_device_name(dev)
-
-        cursor.execute(" SELECT"
-                       "     transform_params"
-                       "  FROM "
-                       f"    {TIMINGS_TABLENAME}"
-                       " WHERE ("
-                       "    transform_id = ?"
-                       "    AND subscripts = ?"
-                       "    AND index_to_length = ?"
-                       "    AND use_matrix = ?"
-                       "    AND value_to_dtype = ?"
-                       "    AND giga_op_info = ?"
-                       "    AND device_name = ?"
-                       ");",
-                       (self.transform_space_id, subscripts, index_to_length,
-                        use_matrix, value_to_dtype, op_info, device_name))
+        # a configuration may have been timed several times, parse each only
+        # once.
+        transform_params_strs = dict.fromkeys(
+            transform_params_str
+            for transform_id, transform_params_str, _ in self._recorded_facts
+            if transform_id == self.transform_space_id)
 
         return [
             dict(_get_opentuner_config_from_transform_config(
-                load_transform_params(transform_params[0])))
-            for transform_params in cursor.fetchall()
+                load_transform_params(transform_params_str)))
+            for transform_params_str in transform_params_strs
         ]
 
-    def query_from_db(self, parameters: Mapping[str, Any]) -> float:
-        import json
-        from feinsum.sql_utils import (dump_index_to_length,
-                                       dump_use_matrix,
-                                       dump_op_info,
-                                       dump_value_to_dtype,
-                                       dump_device_name)
+    @cached_property
+    def _recorded_runtimes(self) -> Dict[str, float]:
+        """
+        Mapping from the stringified transform parameters to the best runtime
+        recorded in the database for :attr:`einsum` on the tuned device.
+        Kept in sync by :meth:`record_into_db`.
+        """
+        recorded_runtimes: Dict[str, float] = {}
+        for _, transform_params_str, runtime in self._recorded_facts:
+            recorded_runtimes[transform_params_str] = min(
+                runtime, recorded_runtimes.get(transform_params_str, np.inf))
 
-        cursor = self.conn.cursor()
-        subscripts = self.einsum.get_subscripts()
-        index_to_length = dump_index_to_length(self.einsum)
-        use_matrix = dump_use_matrix(self.einsum)
-        value_to_dtype = dump_value_to_dtype(self.einsum)
-        transform_params_str = json.dumps(parameters, sort_keys=True)
-        op_info = dump_op_info(self.einsum, self.long_dim_length)
-        dev, = self.cl_ctx.devices
-        device_name = dump_device_name(dev)
-
-        cursor.execute(" SELECT"
-                        "     runtime_in_sec"
-                       "  FROM "
-                       f"    {TIMINGS_TABLENAME}"
-                       " WHERE ("
-                       "    subscripts = ?"
-                       "    AND index_to_length = ?"
-                       "    AND use_matrix = ?"
-                       "    AND value_to_dtype = ?"
-                       "    AND transform_params = ?"
-                       "    AND giga_op_info = ?"
-                       "    AND device_name = ?"
-                       ");",
-                       (subscripts, index_to_length, use_matrix,
-                        value_to_dtype, transform_params_str, op_info,
-                        device_name,))
-        stored_results = cursor.fetchall()
+        return recorded_runtimes
 
-        if not stored_results:
-            raise ConfigurationNotInDBError
-        else:
-            # mypy is probably right as the type parsed from the sql is not
-            # obvious to be a float.
-            return min(stored_result[0]  # type: ignore[no-any-return]
-                       for stored_result in stored_results)
-
-    def record_into_db(self, runtime: float, parameters: Mapping[str, Any]) -> None:
-        import json
-        from feinsum.sql_utils import (dump_index_to_length,
-                                       dump_use_matrix,
-                                       dump_value_to_dtype,
-                                       dump_device_name,
-                                       dump_cl_version,
-                                       dump_op_info)
+    def query_from_db(self, parameters: Mapping[str, Any],
+                      *, transform_params_str: Optional[str] = None) -> float:
+        """
+        :param transform_params_str: The serialized *parameters*, if already
+            computed via :func:`feinsum.sql_utils.dump_transform_params`.
+        """
+        if transform_params_str is None:
+            from feinsum.sql_utils import dump_transform_params
+            transform_params_str = dump_transform_params(parameters)
 
-        cursor = self.conn.cursor()
-        subscripts = self.einsum.get_subscripts()
-        index_to_length = dump_index_to_length(self.einsum)
-        use_matrix = dump_use_matrix(self.einsum)
-        value_to_dtype = dump_value_to_dtype(self.einsum)
-        transform_params_str = json.dumps(parameters, sort_keys=True)
-        cl_device, = self.cl_ctx.devices
-        device_name = dump_device_name(cl_device)
-        compiler_version = dump_cl_version(cl_device)
-        op_info = dump_op_info(self.einsum, long_dim_length=self.long_dim_length)
+        try:
+            return self._recorded_runtimes[transform_params_str]
+        except KeyError:
+            raise ConfigurationNotInDBError
 
-        # {{{ compute timestamp in Chicago
+    def record_into_db(self, runtime: float, parameters: Mapping[str, Any],
+                       *, transform_params_str: Optional[str] = None) -> None:
+        """
+        :param transform_params_str: The serialized *parameters*, if already
+            computed via :func:`feinsum.sql_utils.dump_transform_params`.
+        """
+        if transform_params_str is None:
+            from feinsum.sql_utils import dump_transform_params
+            transform_params_str = dump_transform_params(parameters)
 
-        import pytz
-        from datetime import datetime
+        timestamp = _get_current_timestamp()
 
-        timestamp = (datetime
-                     .now(pytz.timezone("America/Chicago"))
-                     .strftime("%Y_%m_%d_%H%M%S"))
+        self._pending_records.append(
+            (self._subscripts, self._index_to_length, self._use_matrix,
+             self._value_to_dtype, self._device_name, self.transform_space_id,
+             transform_params_str, runtime, self._compiler_version,
+             self._op_info, timestamp))
+        self._recorded_runtimes[transform_params_str] = min(
+            runtime, self._recorded_runtimes.get(transform_params_str, np.inf))
 
-        # }}}
+        if len(self._pending_records) >= N_RECORDS_PER_DB_COMMIT:
+            self.flush_records()
 
-        cursor.execute(f"INSERT INTO {TIMINGS_TABLENAME}"
-                       " (subscripts, index_to_length, use_matrix,"
-                       "  value_to_dtype, device_name, transform_id,"
-                       "  transform_params, runtime_in_sec,"
-                       "  compiler_version, giga_op_info, timestamp)"
-                       " VALUES (?,?,?,?,?,?,?,?,?,?,?)",
-                       (subscripts, index_to_length, use_matrix,
-                       value_to_dtype, device_name, self.transform_space_id,
-                       transform_params_str, runtime, compiler_version,
-                       op_info, timestamp))
-
-        self.conn.commit()
+    def flush_records(self) -> None:
+        """
+        Writes the timing facts buffered by :meth:`record_into_db` to the
+        database.
+        """
+        _write_timing_facts(self.conn, self._pending_records)
 
-    def run(self, desired_result: "opentuner.DesiredResult",
-            input: Any, limit: Any) -> "opentuner.Result":
-        from feinsum.measure import (timeit,
-                                     stringify_comparison_vs_roofline)
+    def compile(self, config_data: Mapping[str, Any],
+                id: Any) -> "_CompiledConfiguration":
+        """
+        Transforms, generates code for and builds the kernel for the
+        configuration *config_data* by validating it. Called by
+        :mod:`opentuner` concurrently for a batch of configurations, which are
+        then timed by :meth:`run_precompiled` re-using the built kernels.
+        """
+        from feinsum.measure import _get_validated_transformed_t_unit
         from feinsum.diagnostics import InvalidParameterError
+        from feinsum.sql_utils import dump_transform_params
 
         cfg = _reconstruct_transform_params_from_opentuner_config(
-            desired_result.configuration.data,
+            config_data,
             self.transform_func.transform_params,
             self.einsum,
         )
+        transform_params_str = dump_transform_params(cfg)
+
+        try:
+            self.query_from_db(cfg, transform_params_str=transform_params_str)
+        except ConfigurationNotInDBError:
+            pass
+        else:
+            return _CompiledConfiguration(cfg, transform_params_str)
+
+        if not self.transform_func.is_valid(
+                self.einsum,
+                einsum_derived_args=self._einsum_derived_args,
+                **cfg):
+            return _CompiledConfiguration(
+                cfg, transform_params_str,
+                error=InvalidParameterError("Violates the transform space's"
+                                            " constraints"))
+
+        bound_transform = self.transform_func.bind_args(
+            self.einsum,
+            einsum_derived_args=self._einsum_derived_args,
+            **cfg)
 
-        logger.info(cfg)
+        try:
+            t_unit = _get_validated_transformed_t_unit(self.einsum, self.cl_ctx,
+                                                       bound_transform)
+        except InvalidParameterError as err:
+            return _CompiledConfiguration(cfg, transform_params_str, error=err)
+
+        return _CompiledConfiguration(cfg, transform_params_str, t_unit=t_unit)
+
+    def run_precompiled(self, desired_result: "opentuner.DesiredResult",
+                        input: Any, limit: Any,
+                        compile_result: "_CompiledConfiguration",
+                        id: Any) -> "opentuner.Result":
+        logger.info(compile_result.cfg)
 
         # {{{ query from DB
 
+        # re-queried as a configuration may have been timed after it was
+        # compiled, for e.g. if it appeared twice in a batch.
         try:
-            result = self.query_from_db(cfg)
+            result = self.query_from_db(
+                compile_result.cfg,
+                transform_params_str=compile_result.transform_params_str)
         except ConfigurationNotInDBError:
             pass
         else:
@@ -536,29 +775,75 @@ class OpentunerTuner(opentuner.MeasurementInterface):  # type: ignore[misc]
 
         # }}}
 
-        bound_transform = self.transform_func.bind_args(self.einsum,
-                                                        **cfg)
-
-        try:
-            logger.info("\n"+stringify_comparison_vs_roofline(
-                self.einsum,
-                transform=bound_transform,
-                cl_ctx=self.cl_ctx,
-                long_dim_length=self.long_dim_length,
-            ))
-        except InvalidParameterError as err:
-            logger.info(f"Ignored configuration due to '{err}'.")
+        if compile_result.error is not None:
+            logger.info(f"Ignored configuration due to '{compile_result.error}'.")
             return opentuner.Result(time=np.inf)
 
-        runtime = timeit(self.einsum,
-                         cl_ctx=self.cl_ctx,
-                         transform=bound_transform,
-                         long_dim_length=self.long_dim_length
-                         )
-        self.record_into_db(runtime, cfg)
+        assert compile_result.t_unit is not None
+        return self._time_transformed_t_unit(compile_result.cfg,
+                                             compile_result.transform_params_str,
+                                             compile_result.t_unit)
+
+    def run(self, desired_result: "opentuner.DesiredResult",
+            input: Any, limit: Any) -> "opentuner.Result":
+        return self.run_precompiled(
+            desired_result, input, limit,
+            self.compile(desired_result.configuration.data, None), None)
+
+    def _time_transformed_t_unit(self, cfg: Mapping[str, Any],
+                                 transform_params_str: str,
+                                 t_unit: lp.TranslationUnit,
+                                 ) -> "opentuner.Result":
+        """
+        Times *t_unit*, the validated translation unit for the configuration
+        *cfg*, and records the runtime into the database.
+        """
+        from feinsum.measure import (_timeit_transformed_t_unit,
+                                     _stringify_runtime_vs_roofline)
+
+        runtime = _timeit_transformed_t_unit(
+            self.einsum, t_unit,
+            cl_ctx=self.cl_ctx,
+            long_dim_length=self.long_dim_length,
+            schedule=None,
+            preallocated_args=self._input_arrays,
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # counting the einsum's operations for the report is expensive,
+            # only done when debugging. Re-uses the measured runtime instead of
+            # timing the kernel again.
+            logger.debug("\n"+_stringify_runtime_vs_roofline(
+                self.einsum, runtime, self.cl_device.name,
+                self.long_dim_length))
+
+        self.record_into_db(runtime, cfg,
+                            transform_params_str=transform_params_str)
 
         return opentuner.Result(time=runtime)
 
+
+@dataclass(frozen=True)
+class _CompiledConfiguration:
+    """
+    The result of :meth:`OpentunerTuner.compile` for a configuration, handed
+    to :meth:`OpentunerTuner.run_precompiled`.
+
+    .. attribute:: t_unit
+
+        The validated translation unit for the configuration, *None* if the
+        configuration was found in the database or was rejected.
+
+    .. attribute:: error
+
+        The :class:`~feinsum.diagnostics.InvalidParameterError` the
+        configuration was rejected with, if any.
+    """
+    cfg: Mapping[str, Any]
+    transform_params_str: str
+    t_unit: Optional[lp.TranslationUnit] = None
+    error: Optional[Exception] = None
+
 # }}}
 
 
@@ -567,6 +852,7 @@ def autotune(einsum: FusedEinsum, module_path: str, cl_ctx: cl.Context,
              db_path: Optional[str] = None,
              long_dim_length: int = 100_000,
              stop_after: Optional[int] = None,
+             techniques: Optional[Sequence[str]] = None,
              ) -> None:
     """
     For a transform space specified in *module_path*, searches the parameter
@@ -574,6 +860,10 @@ def autotune(einsum: FusedEinsum, module_path: str, cl_ctx: cl.Context,
 
     :param stop_after: After these many trials the routine exits. Pass *None*
         to go on indefinitely.
+    :param techniques: Names of the :mod:`opentuner` search techniques to
+        drive the search with, for e.g. ``["PatternSearch"]`` or
+        ``["RandomNelderMead"]`` on smooth parameter spaces. Pass *None* to use
+        :mod:`opentuner`'s default ensemble of techniques.
     """
     if not os.path.isabs(module_path):
         raise ValueError("autotune expects an absolute path for the module")
@@ -584,20 +874,28 @@ def autotune(einsum: FusedEinsum, module_path: str, cl_ctx: cl.Context,
     from argparse import Namespace  # :puke: but required by opentuner. Big brain.
 
     kwargs: Mapping[str, Any] = {
-        "machine_class": None, "parallel_compile": False,
+        "machine_class": None, "parallel_compile": True,
         "test_limit": None, "stop_after": stop_after, "parallelism": 4,
         "pipelining": 0, "bail_threshold": 100, "no_dups": True,
         "seed_configuration": [], "results_log": None,
         "results_log_details": None, "quiet": False, "display_frequency": 10,
-        "technique": None, "list_techniques": False,
+        "technique": list(techniques) if techniques is not None else None,
+        "list_techniques": False,
         "generate_bandit_technique": False, "label": None,
         "print_search_space_size": False, "database": None,
         "print_params": False
     }
 
-    OpentunerTuner.main(args=Namespace(**kwargs),
-                        einsum=einsum, cl_ctx=cl_ctx, module_path=module_path,
-                        db_path=db_path,
-                        long_dim_length=long_dim_length)
+    from opentuner.tuningrunmain import TuningRunMain
+
+    args = Namespace(**kwargs)
+    tuner = OpentunerTuner(args=args,
+                           einsum=einsum, cl_ctx=cl_ctx, module_path=module_path,
+                           db_path=db_path,
+                           long_dim_length=long_dim_length)
+    try:
+        TuningRunMain(tuner, args).main()
+    finally:
+        tuner.flush_records()
 
 # vim: fdm=marker
@@ -1,5 +1,5 @@
 from feinsum.tuning import IntParameter
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 
 import feinsum as fnsm
 import numpy as np
@@ -9,7 +9,80 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Resource limits assumed while pruning the parameter space.
+MAX_WORK_ITEMS_PER_WG = 600
+MAX_SHARED_MEM_PER_WG = 47e3  # in bytes
+ITEMSIZE = np.dtype(np.float64).itemsize  # in bytes
+
+
+def _get_padded_length(n: int) -> int:
+    """
+    Returns the length to which an array axis of length *n* is padded to have an
+    odd stride. Rows of 64-bit words with an odd stride are accessed without
+    local memory bank conflicts by the work-items in a sub-group.
+    """
+    return n + 1 if n % 2 == 0 else n
+
+
+def _get_resource_usage(ndim: int, ndof: int,
+                        n_e_per_wg: int, nwork_items_per_e: int,
+                        i_tiles: int, j_tiles: int,
+                        prftch_u_to_local: bool = False) -> Tuple[int, int]:
+    """
+    Returns a tuple of the number of work-items per work-group and the local
+    memory (in bytes) per work-group needed by :func:`transform`.
+    """
+    nwork_items_per_wg = n_e_per_wg * nwork_items_per_e
+    shared_mem_per_wg = (
+        math.ceil((ndof*ndim)/i_tiles) * _get_padded_length(math.ceil(ndof/j_tiles))
+        + int(prftch_u_to_local) * _get_padded_length(ndof) * n_e_per_wg
+        + ndim * ndof * n_e_per_wg)*ITEMSIZE
+
+    return nwork_items_per_wg, shared_mem_per_wg
+
+
+def _is_within_resource_limits(ndim: int, ndof: int,
+                               n_e_per_wg: int, nwork_items_per_e: int,
+                               i_tiles: int, j_tiles: int) -> bool:
+    nwork_items_per_wg, shared_mem_per_wg = _get_resource_usage(
+        ndim, ndof, n_e_per_wg, nwork_items_per_e, i_tiles, j_tiles)
+
+    return (nwork_items_per_wg <= MAX_WORK_ITEMS_PER_WG
+            and shared_mem_per_wg <= MAX_SHARED_MEM_PER_WG)
+
+
+def _pad_local_temporary(t_unit: lp.TranslationUnit,
+                         kernel_name: str,
+                         var_name: str) -> lp.TranslationUnit:
+    """
+    Pads the innermost axis of the temporary *var_name* to
+    :func:`_get_padded_length`.
+    """
+    from pytools import product
 
+    knl = t_unit[kernel_name]
+    shape = knl.temporary_variables[var_name].shape
+    assert isinstance(shape, tuple) and all(isinstance(s, int) for s in shape)
+    *outer_shape, inner_len = shape
+    assert isinstance(inner_len, int)
+    storage_shape = (*outer_shape, _get_padded_length(inner_len))
+
+    if storage_shape[-1] == inner_len:
+        return t_unit
+
+    knl = lp.tag_array_axes(
+        knl, var_name,
+        ",".join(f"stride:{product(storage_shape[iaxis+1:])}"
+                 for iaxis in range(len(storage_shape))))
+    tv = knl.temporary_variables[var_name]
+    knl = knl.copy(temporary_variables={
+        **knl.temporary_variables,
+        var_name: tv.copy(storage_shape=storage_shape)})
+
+    return t_unit.with_kernel(knl)
+
+
+@fnsm.tuning.parameter_constraint(_is_within_resource_limits)
 @fnsm.tuning.einsum_arg(
     "ndim", lambda e: e.shape[0])
 @fnsm.tuning.einsum_arg(
@@ -31,12 +104,14 @@ def transform(t_unit: lp.TranslationUnit,
               insn_match: Optional[Any] = None,
               kernel_name: Optional[str] = None) -> lp.TranslationUnit:
 
-    if n_e_per_wg * nwork_items_per_e > 600:
+    nwork_items_per_wg, shared_mem_per_wg = _get_resource_usage(
+        ndim, ndof, n_e_per_wg, nwork_items_per_e, i_tiles, j_tiles,
+        prftch_u_to_local)
+
+    if nwork_items_per_wg > MAX_WORK_ITEMS_PER_WG:
         raise fnsm.InvalidParameterError("Block dimension limit exceeded")
 
-    if ((math.ceil((ndof*ndim)/i_tiles) * math.ceil(ndof/j_tiles))
-            + int(prftch_u_to_local) * ndof * n_e_per_wg
-            + ndim * ndof * n_e_per_wg)*8e-3 > 47:
+    if shared_mem_per_wg > MAX_SHARED_MEM_PER_WG:
         raise fnsm.InvalidParameterError("Shared memory limit exceeded")
 
     from loopy.match import parse_match
@@ -130,6 +205,7 @@ def transform(t_unit: lp.TranslationUnit,
                                default_tag=None,
                                within=within
                                )
+        t_unit = _pad_local_temporary(t_unit, kernel_name, u_fetch)
         t_unit = lp.tag_inames(t_unit, {eprftch_u: "l.1"})
         t_unit = lp.split_iname(t_unit, jprftch_u, nwork_items_per_e,
                                 inner_tag="l.0")
@@ -175,6 +251,7 @@ def transform(t_unit: lp.TranslationUnit,
                            temporary_name=D_fetch,
                            within=within,
                            default_tag=None)
+    t_unit = _pad_local_temporary(t_unit, kernel_name, D_fetch)
     t_unit = lp.split_iname(t_unit, iprftch_D, n_e_per_wg, inner_tag="l.1")
     t_unit = lp.split_iname(t_unit, jprftch_D, nwork_items_per_e, inner_tag="l.0")
 
@@ -228,7 +305,9 @@ def transform(t_unit: lp.TranslationUnit,
 
     # }}}
 
-    t_unit = lp.tag_inames(t_unit, {r: "unr"})
+    # unrolling 'x' lets the 'ndim' output components share the loads of the
+    # precomputed 'subst' values from the private memory.
+    t_unit = lp.tag_inames(t_unit, {r: "unr", x: "unr"})
 
     if not prftch_u_to_local:
         # TODO: Yet another headache to ensure that the fetch instruction uses all
@@ -56,6 +56,51 @@ def test_matvec_with_long_dim_result(ctx_factory):
              cl_ctx=cl_ctx)
 
 
+def test_timeit_with_preallocated_args(ctx_factory, monkeypatch):
+    import pytest
+    import pyopencl as cl
+    import feinsum.measure
+    from feinsum.measure import generate_input_arrays
+
+    cl_ctx = ctx_factory()
+    expr = f.fused_einsum("ij, j -> i",
+                        ((np.inf, 4), (4,)),
+                        dtypes="float32",
+                        use_matrix=[[{"I0", "I1"}, {"I3", "I2"}],
+                                    [{"I1", "I4"}, {"I2"}]]
+                        )
+    cq = cl.CommandQueue(cl_ctx)
+    input_arrays = generate_input_arrays(cq, expr, long_dim_length=1000)
+
+    # record the lengths of the inputs generated by timeit
+    generated_lengths = []
+
+    def generate_input_arrays_spy(queue, einsum, long_dim_length, np_seed=0):
+        generated_lengths.append(long_dim_length)
+        return generate_input_arrays(queue, einsum, long_dim_length, np_seed)
+
+    monkeypatch.setattr(feinsum.measure, "generate_input_arrays",
+                        generate_input_arrays_spy)
+
+    f.timeit(expr,
+             transform=lambda t_unit, insn_match, kernel_name: t_unit,
+             cl_ctx=cl_ctx,
+             long_dim_length=1000,
+             preallocated_args=input_arrays)
+
+    # only the (smaller) inputs of the validation are generated, the timed
+    # kernel runs on input_arrays.
+    assert generated_lengths
+    assert 1000 not in generated_lengths
+
+    with pytest.raises(ValueError):
+        f.timeit(expr,
+                 transform=lambda t_unit, insn_match, kernel_name: t_unit,
+                 cl_ctx=cl_ctx,
+                 long_dim_length=1000,
+                 preallocated_args=input_arrays.delete("I0"))
+
+
 def test_pprint_roofline_comparison(ctx_factory):
     cl_ctx = ctx_factory()
 
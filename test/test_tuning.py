@@ -0,0 +1,63 @@
+__copyright__ = """Copyright (C) 2021 Kaushik Kulkarni"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import os
+import numpy as np
+from pyopencl.tools import (  # noqa
+        pytest_generate_tests_for_pyopencl as pytest_generate_tests)
+import feinsum as f
+
+
+def test_tuner_db_round_trip(ctx_factory, tmp_path):
+    from argparse import Namespace
+    from itertools import product
+    from feinsum.tuning import OpentunerTuner, N_RECORDS_PER_DB_COMMIT
+
+    cl_ctx = ctx_factory()
+    expr = f.einsum("ijk->ij", f.array((np.inf, 72,  4), np.float64))
+    module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               "tuning_impls_tests", "test_tuple_args.py")
+    db_path = str(tmp_path / "timings.sqlite")
+
+    def make_tuner():
+        return OpentunerTuner(Namespace(parallel_compile=False), expr, cl_ctx,
+                              module_path, 1000, db_path)
+
+    wg_sizes = list(product(range(8, 17), range(8, 17)))
+    assert len(wg_sizes) > N_RECORDS_PER_DB_COMMIT
+
+    tuner = make_tuner()
+    for i, wg_size in enumerate(wg_sizes):
+        tuner.record_into_db(1.0 + i, {"wg_size": wg_size})
+    # time a couple of configurations again, once faster and once slower
+    tuner.record_into_db(0.5, {"wg_size": wg_sizes[0]})
+    tuner.record_into_db(100.0, {"wg_size": wg_sizes[1]})
+    tuner.flush_records()
+
+    fresh_tuner = make_tuner()
+    assert fresh_tuner.query_from_db({"wg_size": wg_sizes[0]}) == 0.5
+    assert fresh_tuner.query_from_db({"wg_size": wg_sizes[1]}) == 2.0
+
+    seeds = fresh_tuner.seed_configurations()
+    assert len(seeds) == len(wg_sizes)
+    assert len({tuple(sorted(seed.items())) for seed in seeds}) == len(wg_sizes)
@@ -0,0 +1,51 @@
+import loopy as lp
+from typing import Optional, Any
+import feinsum as f
+import numpy as np
+from feinsum.tuning import transform_param, parameter_constraint, IntParameter
+from pyopencl.tools import (  # noqa
+        pytest_generate_tests_for_pyopencl as pytest_generate_tests)
+
+
+@parameter_constraint(lambda l_0_size, l_1_size: l_0_size * l_1_size <= 128)
+@transform_param("l_0_size", lambda ensm: IntParameter(8, 16))
+@transform_param("l_1_size", lambda ensm: IntParameter(8, 16))
+def transform(t_unit: lp.TranslationUnit,
+              l_0_size: int, l_1_size: int,
+              insn_match: Optional[Any] = None,
+              kernel_name: Optional[str] = None) -> lp.TranslationUnit:
+    ref_einsum = f.einsum("ijk->ij", f.array((np.inf, 72,  4), np.float64))
+    subst_map = f.match_t_unit_to_einsum(t_unit, ref_einsum,
+                                         insn_match=insn_match,
+                                         kernel_name=kernel_name)
+    i = subst_map["i"]
+    j = subst_map["j"]
+
+    # the tuner must not apply the transform for configurations violating the
+    # constraint
+    assert l_0_size * l_1_size <= 128
+
+    t_unit = lp.split_iname(t_unit, i, l_1_size, inner_tag="l.1", outer_tag="g.0")
+    t_unit = lp.split_iname(t_unit, j, l_0_size, inner_tag="l.0")
+
+    return t_unit
+
+
+def test_is_valid():
+    import os
+    from feinsum.tuning import get_transform_func_from_module_path
+
+    expr = f.einsum("ijk->ij", f.array((np.inf, 72,  4), np.float64))
+    transform_func = get_transform_func_from_module_path(os.path.abspath(__file__))
+
+    assert transform_func.is_valid(expr, l_0_size=8, l_1_size=16)
+    assert not transform_func.is_valid(expr, l_0_size=9, l_1_size=16)
+
+
+def test_transform(ctx_factory, tmp_path):
+    import os
+    cl_ctx = ctx_factory()
+
+    expr = f.einsum("ijk->ij", f.array((np.inf, 72,  4), np.float64))
+    f.autotune(expr, os.path.abspath(__file__), cl_ctx,
+               db_path=str(tmp_path / "timings.sqlite"), stop_after=3)